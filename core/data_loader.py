@@ -1,5 +1,6 @@
 import pandas as pd
 import os
+import fnmatch
 from pathlib import Path
 import logging
 from typing import Dict, List, Optional
@@ -39,6 +40,10 @@ class DataLoader:
         # NEW: Create resampler instance
         self.resampler = DataResampler()
 
+        # Parquet names in data_dir, listed on first fallback lookup and
+        # reused for every later symbol handled by this loader
+        self._parquet_files: Optional[List[str]] = None
+
         # Validate data directory exists
         if not os.path.exists(self.data_dir):
             raise FileNotFoundError(f"Data directory not found: {self.data_dir}")
@@ -238,22 +243,46 @@ class DataLoader:
         ]
 
         for pattern in patterns:
-            import glob
+            # Literal file name: a single stat, no directory listing needed
+            if not any(char in pattern for char in "*?["):
+                candidate = os.path.join(self.data_dir, pattern)
+                if os.path.exists(candidate):
+                    return candidate
+                continue
 
-            matches = glob.glob(os.path.join(self.data_dir, pattern))
+            # Wildcards: match against the (per-loader) directory listing
+            matches = fnmatch.filter(self._list_parquet_files(), pattern)
             if matches:
                 # Return first match
-                return matches[0]
-
-        # List available files for error message
-        available = [f for f in os.listdir(self.data_dir) if f.endswith(".parquet")]
+                return os.path.join(self.data_dir, matches[0])
 
         raise FileNotFoundError(
             f"No parquet file found for symbol '{symbol}' in {self.data_dir}\n"
-            f"Available files: {available}\n"
+            f"Available files: {self._list_parquet_files()}\n"
             f"Please specify 'source_file' in config.yaml"
         )
 
+    def _list_parquet_files(self) -> List[str]:
+        """
+        Return parquet file names in data_dir (listed once per loader).
+
+        Returns:
+            List of names (not paths), hidden and dangling entries excluded
+        """
+        if self._parquet_files is None:
+            # scandir's DirEntry answers is_file/is_dir from the directory
+            # read itself (no per-file stat); dangling symlinks are skipped.
+            # Directories stay: a partitioned dataset is a *.parquet folder.
+            with os.scandir(self.data_dir) as entries:
+                self._parquet_files = [
+                    entry.name
+                    for entry in entries
+                    if entry.name.endswith(".parquet")
+                    and not entry.name.startswith(".")
+                    and (entry.is_file() or entry.is_dir())
+                ]
+        return self._parquet_files
+
     def load_all_symbols(self) -> Dict[str, pd.DataFrame]:
         """
         Load data for all symbols specified in config.
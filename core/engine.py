@@ -164,8 +164,9 @@ class BacktestEngine:
                         self._enter_position(i, data_window, direction)
                     else:
                         logger.debug(
-                            f"Skipping {direction} entry at {current_time} "
-                            f"(direction not enabled)"
+                            "Skipping %s entry at %s (direction not enabled)",
+                            direction,
+                            current_time,
                         )
 
             else:
@@ -263,16 +264,26 @@ class BacktestEngine:
                 logger.warning("No journal data available for TP/SL enhancement")
                 return
 
-            # Crea DataFrame dal journal
-            journal_df = pd.DataFrame(self.journal)
-
-            # Crea Series per TP/SL
-            tp_series = pd.Series(
-                journal_df["take_profit"].values, index=journal_df["timestamp"]
-            )
-
-            sl_series = pd.Series(
-                journal_df["stop_loss"].values, index=journal_df["timestamp"]
+            # Estrai solo le colonne necessarie dal journal (niente DataFrame
+            # con tutte le colonne: None -> NaN direttamente in float64)
+            journal = self.journal
+            journal_cols = pd.DataFrame(
+                {
+                    "take_profit": np.array(
+                        [j["take_profit"] for j in journal], dtype=np.float64
+                    ),
+                    "stop_loss": np.array(
+                        [j["stop_loss"] for j in journal], dtype=np.float64
+                    ),
+                    "in_position": np.array(
+                        [j["in_position"] for j in journal], dtype=bool
+                    ),
+                    "position_type": [
+                        j.get("position_type") if j.get("in_position") else None
+                        for j in journal
+                    ],
+                },
+                index=pd.DatetimeIndex([j["timestamp"] for j in journal]),
             )
 
             # Crea una copia del data originale con indicatori
@@ -280,21 +291,10 @@ class BacktestEngine:
 
             # Aggiungi colonne TP/SL al DataFrame principale
             # Nota: potrebbero esserci timestamp mancanti, quindi usiamo reindex
-            enhanced_data["take_profit"] = tp_series.reindex(enhanced_data.index)
-            enhanced_data["stop_loss"] = sl_series.reindex(enhanced_data.index)
-
-            # Aggiungi altre informazioni utili dal journal
-            enhanced_data["in_position"] = pd.Series(
-                journal_df["in_position"].values, index=journal_df["timestamp"]
-            ).reindex(enhanced_data.index)
-
-            enhanced_data["position_type"] = pd.Series(
-                [
-                    j.get("position_type") if j.get("in_position") else None
-                    for j in self.journal
-                ],
-                index=journal_df["timestamp"],
-            ).reindex(enhanced_data.index)
+            # (un solo reindex per tutte le colonne)
+            journal_cols = journal_cols.reindex(enhanced_data.index)
+            for col in journal_cols.columns:
+                enhanced_data[col] = journal_cols[col]
 
             # Salva nel risultato
             results["data_with_indicators"] = enhanced_data
@@ -306,15 +306,15 @@ class BacktestEngine:
                 f"Columns added: {[c for c in enhanced_data.columns if 'take' in c or 'stop' in c or 'position' in c]}"
             )
 
-            # Log di esempio per debug
-            if not enhanced_data["take_profit"].isna().all():
+            # Log di esempio per debug (scansioni complete: solo se INFO attivo)
+            if logger.isEnabledFor(logging.INFO):
                 tp_count = enhanced_data["take_profit"].notna().sum()
-                logger.info(f"TP values available for {tp_count} candles")
+                if tp_count:
+                    logger.info("TP values available for %d candles", tp_count)
 
-                # Mostra alcuni valori di esempio
-                sample_tp = enhanced_data["take_profit"].dropna().head(3)
-                if len(sample_tp) > 0:
-                    logger.info(f"Sample TP values:\n{sample_tp}")
+                    # Mostra alcuni valori di esempio
+                    sample_tp = enhanced_data["take_profit"].dropna().head(3)
+                    logger.info("Sample TP values:\n%s", sample_tp)
 
         except Exception as e:
             logger.error(f"Error enhancing results with TP/SL data: {e}")
@@ -598,7 +598,7 @@ class BacktestEngine:
                     float(sl_level) if sl_level is not None else None
                 )
             except Exception as e:
-                logger.debug(f"Could not get TP/SL levels: {e}")
+                logger.debug("Could not get TP/SL levels: %s", e)
 
             journal_entry.update(
                 {
@@ -717,11 +717,16 @@ class BacktestEngine:
         # ✅ IMPORTANT: Max Drawdown calculation
         # This measures the largest peak-to-trough decline in equity
         # It's NOT limited by risk per trade -> Consecutive losses accumulate!
-        equity_values = [e["equity"] for e in self.equity_curve]
-        if equity_values:
+        # Equity pulled once into a float64 array (no list -> array round trips)
+        equity_values = np.fromiter(
+            (e["equity"] for e in self.equity_curve),
+            dtype=np.float64,
+            count=len(self.equity_curve),
+        )
+        if equity_values.size:
             running_max = np.maximum.accumulate(equity_values)
             drawdowns = (equity_values - running_max) / running_max * 100
-            max_drawdown = abs(min(drawdowns)) if len(drawdowns) > 0 else 0
+            max_drawdown = abs(drawdowns.min())
         else:
             max_drawdown = 0
 
@@ -67,7 +67,9 @@ class IndicatorManager:
                             self.calculators[indicator_name] = obj
 
                             logger.debug(
-                                f"Discovered indicator: {indicator_name} -> {obj.__name__}"
+                                "Discovered indicator: %s -> %s",
+                                indicator_name,
+                                obj.__name__,
                             )
 
                 except Exception as e:
@@ -180,7 +182,9 @@ class IndicatorManager:
         else:
             column_name = name
 
-        logger.debug(f"Generated column name: {column_name} from {indicator_config}")
+        logger.debug(
+            "Generated column name: %s from %s", column_name, indicator_config
+        )
 
         return column_name
 
@@ -236,7 +240,7 @@ class IndicatorManager:
             # Add to params
             params["data_file_path"] = str(file_path)
 
-            logger.debug(f"CVD data file path: {file_path}")
+            logger.debug("CVD data file path: %s", file_path)
 
         # Calculate with caching
         values = calculator.calculate_with_cache(data, params, column_name)
@@ -264,22 +268,22 @@ class IndicatorManager:
         # Collect from entry strategy
         if hasattr(entry, "indicators") and entry.indicators:
             all_indicators.extend(entry.indicators)
-            logger.debug(f"Entry strategy needs {len(entry.indicators)} indicators")
+            logger.debug("Entry strategy needs %d indicators", len(entry.indicators))
 
         # Collect from exit strategy
         if hasattr(exit, "indicators") and exit.indicators:
             all_indicators.extend(exit.indicators)
-            logger.debug(f"Exit strategy needs {len(exit.indicators)} indicators")
+            logger.debug("Exit strategy needs %d indicators", len(exit.indicators))
 
         # Collect from risk manager
         if hasattr(risk, "indicators") and risk.indicators:
             all_indicators.extend(risk.indicators)
-            logger.debug(f"Risk manager needs {len(risk.indicators)} indicators")
+            logger.debug("Risk manager needs %d indicators", len(risk.indicators))
 
         # Add extra indicators for plotting/analysis
         if extra_indicators:
             all_indicators.extend(extra_indicators)
-            logger.debug(f"Extra indicators for plotting: {len(extra_indicators)}")
+            logger.debug("Extra indicators for plotting: %d", len(extra_indicators))
 
         # Deduplicate based on config content
         unique_indicators = []
@@ -70,10 +70,14 @@ class ATRCalculator(BaseCalculator):
         # Set name
         atr.name = f"atr_{period}"
 
-        logger.debug(
-            f"ATR stats: min={atr.min():.4f}, "
-            f"max={atr.max():.4f}, mean={atr.mean():.4f}"
-        )
+        # Stats are full passes over the series: only compute them for DEBUG
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "ATR stats: min=%.4f, max=%.4f, mean=%.4f",
+                atr.min(),
+                atr.max(),
+                atr.mean(),
+            )
 
         return atr
 
@@ -3,6 +3,8 @@ import numpy as np
 import hashlib
 import json
 import os
+import pyarrow.parquet as pq
+from functools import lru_cache
 from pathlib import Path
 from abc import ABC, abstractmethod
 import logging
@@ -11,6 +13,17 @@ from typing import Dict, Any, Optional
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _parquet_metadata(path: str, mtime_ns: int) -> pq.FileMetaData:
+    """
+    Read (and cache) a parquet file's footer metadata.
+
+    Keyed by modification time, so a rewritten cache file is re-read.
+    Raises if the file is not valid parquet.
+    """
+    return pq.read_metadata(path)
+
+
 class BaseCalculator(ABC):
     """
     Abstract base class for all indicator calculators.
@@ -34,6 +47,10 @@ class BaseCalculator(ABC):
         self.symbol_cache_dir = self.cache_dir / symbol
         self.symbol_cache_dir.mkdir(parents=True, exist_ok=True)
 
+        # Sorted param string -> cache key (get_cache_key runs several
+        # times per calculate_with_cache for the same params)
+        self._cache_keys: Dict[str, str] = {}
+
     @abstractmethod
     def calculate(self, data: pd.DataFrame, params: Dict[str, Any]) -> pd.Series:
         """
@@ -63,6 +80,10 @@ class BaseCalculator(ABC):
         """
         # Create deterministic hash of ALL parameters
         param_str = json.dumps(params, sort_keys=True)
+        cache_key = self._cache_keys.get(param_str)
+        if cache_key is not None:
+            return cache_key
+
         param_hash = hashlib.md5(param_str.encode()).hexdigest()[:8]
 
         indicator_name = self.__class__.__name__.replace("Calculator", "").lower()
@@ -82,8 +103,9 @@ class BaseCalculator(ABC):
         key_parts.append(param_hash)
 
         cache_key = "_".join(key_parts)
+        self._cache_keys[param_str] = cache_key
 
-        logger.debug(f"Cache key: {cache_key} (params: {params})")
+        logger.debug("Cache key: %s (params: %s)", cache_key, params)
 
         return cache_key
 
@@ -120,20 +142,23 @@ class BaseCalculator(ABC):
         Forward-fill higher timeframe indicator values to 1m.
         Each indicator value repeats for N minutes.
         """
-        # Create empty Series with original 1m index
-        result = pd.Series(index=original_index, dtype=float)
+        # Candle i covers the 1m timestamps in [end_i - (N-1) min, end_i]; the
+        # last candle starting at or before a timestamp is the one that covers
+        # it (if any), found for all timestamps with one binary search
+        values = indicator_series.to_numpy(dtype=float)
+        filled = np.full(len(original_index), np.nan)
 
-        # For each higher timeframe value, fill for all 1m periods
-        for idx, value in indicator_series.items():
-            # Calculate start and end of this higher TF candle
-            candle_end = idx
-            candle_start = candle_end - pd.Timedelta(minutes=minutes_per_candle - 1)
+        if len(values):
+            candle_ends = pd.DatetimeIndex(indicator_series.index)
+            candle_starts = candle_ends - pd.Timedelta(minutes=minutes_per_candle - 1)
 
-            # Find all 1m timestamps within this candle
-            mask = (original_index >= candle_start) & (original_index <= candle_end)
+            pos = candle_starts.searchsorted(original_index, side="right") - 1
+            valid = pos >= 0
+            pos = pos[valid]
+            covered = candle_ends[pos] >= original_index[valid]
+            filled[np.flatnonzero(valid)[covered]] = values[pos[covered]]
 
-            # Fill with the indicator value
-            result.loc[mask] = value
+        result = pd.Series(filled, index=original_index)
 
         # Fill any remaining NaN
         result = result.ffill().bfill()
@@ -164,10 +189,7 @@ class BaseCalculator(ABC):
         Returns:
             String representation
         """
-        parts = []
-        for key, value in sorted(params.items()):
-            parts.append(f"{key}{value}")
-        return "_".join(parts)
+        return "_".join(f"{key}{value}" for key, value in sorted(params.items()))
 
     def get_cache_filepath(self, params: Dict[str, Any]) -> Path:
         """
@@ -182,31 +204,64 @@ class BaseCalculator(ABC):
         cache_key = self.get_cache_key(params)
         return self.symbol_cache_dir / f"{cache_key}.parquet"
 
-    def is_cached(self, params: Dict[str, Any]) -> bool:
+    def is_cached(
+        self,
+        params: Dict[str, Any],
+        column_name: Optional[str] = None,
+        expected_rows: Optional[int] = None,
+    ) -> bool:
         """
         Check if indicator is already cached.
 
         Args:
             params: Indicator parameters
+            column_name: Column the cache file must contain (legacy 'value'
+                files are accepted too); not checked if None
+            expected_rows: Row count the cache file must have; not checked
+                if None
 
         Returns:
-            True if cached file exists and is valid
+            True if cached file exists, is valid and matches the request
         """
         cache_file = self.get_cache_filepath(params)
 
-        if not cache_file.exists():
+        try:
+            mtime_ns = cache_file.stat().st_mtime_ns
+        except FileNotFoundError:
             return False
 
         try:
-            # Try to read the file to ensure it's valid
-            pd.read_parquet(cache_file)
-            return True
+            # Validate via the footer only (cached per mtime), not a full read
+            metadata = _parquet_metadata(str(cache_file), mtime_ns)
         except Exception as e:
             logger.warning(f"Cache file corrupted {cache_file}: {e}")
             # Remove corrupted file
             cache_file.unlink(missing_ok=True)
             return False
 
+        # A readable footer is not enough: the stored column and length must
+        # match what is requested (the file is overwritten on recalculation)
+        columns = metadata.schema.names
+        if column_name and column_name not in columns and "value" not in columns:
+            logger.debug(
+                "Cache column mismatch %s: %s not in %s",
+                cache_file.name,
+                column_name,
+                columns,
+            )
+            return False
+
+        if expected_rows is not None and metadata.num_rows != expected_rows:
+            logger.debug(
+                "Cache length mismatch %s: %d rows, expected %d",
+                cache_file.name,
+                metadata.num_rows,
+                expected_rows,
+            )
+            return False
+
+        return True
+
     def save_to_cache(
         self, values: pd.Series, params: Dict[str, Any], column_name: str = None
     ):
@@ -240,7 +295,7 @@ class BaseCalculator(ABC):
             df.attrs["params"] = params
 
             df.to_parquet(cache_file)
-            logger.debug(f"Saved to cache: {cache_file.name} (column: {col_name})")
+            logger.debug("Saved to cache: %s (column: %s)", cache_file.name, col_name)
 
         except Exception as e:
             logger.error(f"Error saving cache {cache_file}: {e}")
@@ -290,7 +345,7 @@ class BaseCalculator(ABC):
                 series.name = df.attrs["column_name"]
 
             logger.debug(
-                f"Loaded from cache: {cache_file.name} (column: {series.name})"
+                "Loaded from cache: %s (column: %s)", cache_file.name, series.name
             )
             return series
 
@@ -312,8 +367,8 @@ class BaseCalculator(ABC):
         Returns:
             Series with calculated values (with correct name)
         """
-        # Check cache first
-        if self.is_cached(params):
+        # Check cache first (column and length checked from the footer)
+        if self.is_cached(params, column_name, expected_rows=len(data)):
             try:
                 cached_values = self.load_from_cache(params)
 
@@ -322,7 +377,7 @@ class BaseCalculator(ABC):
                     data.index
                 ):
                     logger.info(
-                        f"✅ Using cached indicator: {self.get_cache_key(params)}"
+                        "✅ Using cached indicator: %s", self.get_cache_key(params)
                     )
 
                     # If column_name is provided and different from cached name, rename
@@ -332,13 +387,13 @@ class BaseCalculator(ABC):
                     return cached_values
                 else:
                     logger.warning(
-                        f"Cache mismatch, recalculating: {self.get_cache_key(params)}"
+                        "Cache mismatch, recalculating: %s", self.get_cache_key(params)
                     )
             except Exception as e:
                 logger.warning(f"Cache error, recalculating: {e}")
 
         # Calculate fresh
-        logger.info(f"🔄 Calculating indicator: {self.get_cache_key(params)}")
+        logger.info("🔄 Calculating indicator: %s", self.get_cache_key(params))
         values = self.calculate(data, params)
 
         # Set column name if provided
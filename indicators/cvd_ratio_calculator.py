@@ -2,6 +2,7 @@
 
 import pandas as pd
 import numpy as np
+import pyarrow.parquet as pq
 from .base_calculator import BaseCalculator
 import logging
 from typing import Dict, Any, Optional
@@ -27,6 +28,15 @@ class CVDRatioCalculator(BaseCalculator):
       - 100% = CVD at maximum of rolling window (extreme buying)
     """
 
+    # Only these columns of the 1m source file are used
+    SOURCE_COLUMNS = [
+        "timestamp",
+        "volume",
+        "taker_buy_volume",
+        "quote_volume",
+        "taker_buy_quote_volume",
+    ]
+
     def __init__(self, symbol: str, timeframe: str, cache_dir: str = "data/indicators"):
         """Initialize CVD calculator."""
         super().__init__(symbol, timeframe, cache_dir)
@@ -92,11 +102,15 @@ class CVDRatioCalculator(BaseCalculator):
         # Set name
         result.name = f"cvd_{cumulative_minutes}"
 
-        # Log statistics
-        logger.info(
-            f"CVD Signal: min={result.min():.1f}%, max={result.max():.1f}%, "
-            f"mean={result.mean():.1f}%, std={result.std():.1f}%"
-        )
+        # Log statistics (full passes over the series: skip if INFO is off)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "CVD Signal: min=%.1f%%, max=%.1f%%, mean=%.1f%%, std=%.1f%%",
+                result.min(),
+                result.max(),
+                result.mean(),
+                result.std(),
+            )
 
         return result
 
@@ -120,10 +134,14 @@ class CVDRatioCalculator(BaseCalculator):
         logger.info(f"Loading 1m data from: {file_path}")
         logger.info(f"Time range: {filter_start} to {filter_end} (with padding)")
 
+        # Read only the volume columns (OHLC etc. are never used here)
+        columns = self._source_columns(file_path)
+
         # Load with timestamp filtering if possible
         try:
             df = pd.read_parquet(
                 file_path,
+                columns=columns,
                 filters=[
                     ("timestamp", ">=", int(filter_start.timestamp() * 1000)),
                     ("timestamp", "<=", int(filter_end.timestamp() * 1000)),
@@ -132,7 +150,7 @@ class CVDRatioCalculator(BaseCalculator):
             logger.info(f"Loaded {len(df):,} rows (filtered)")
         except Exception:
             # Fallback: load all and filter in memory
-            df = pd.read_parquet(file_path)
+            df = pd.read_parquet(file_path, columns=columns)
             logger.info(f"Loaded {len(df):,} rows (unfiltered)")
 
             # Convert timestamp
@@ -152,6 +170,28 @@ class CVDRatioCalculator(BaseCalculator):
         df.sort_index(inplace=True)
         return df
 
+    def _source_columns(self, file_path: Path) -> Optional[list]:
+        """
+        Pick the columns of the 1m file needed for CVD (schema footer only).
+
+        Args:
+            file_path: Path to 1m parquet file
+
+        Returns:
+            Column list for read_parquet, or None (read all) if the file has
+            none of the expected volume columns
+        """
+        try:
+            available = set(pq.read_schema(file_path).names)
+        except Exception:
+            return None
+
+        columns = [col for col in self.SOURCE_COLUMNS if col in available]
+        # Without volume columns let the full read surface the KeyError
+        if not any(col != "timestamp" for col in columns):
+            return None
+        return columns
+
     def _calculate_volume_delta(self, df: pd.DataFrame, use_quote: bool) -> pd.Series:
         """Calculate volume delta (buy_volume - sell_volume)."""
         if use_quote and "taker_buy_quote_volume" in df.columns:
@@ -168,10 +208,13 @@ class CVDRatioCalculator(BaseCalculator):
         sell_vol = total_vol - buy_vol
         volume_delta = buy_vol - sell_vol
 
-        logger.debug(
-            f"Volume delta: min={volume_delta.min():.0f}, "
-            f"max={volume_delta.max():.0f}, mean={volume_delta.mean():.0f}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Volume delta: min=%.0f, max=%.0f, mean=%.0f",
+                volume_delta.min(),
+                volume_delta.max(),
+                volume_delta.mean(),
+            )
 
         return volume_delta
 
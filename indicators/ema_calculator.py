@@ -61,12 +61,15 @@ class EMACalculator(BaseCalculator):
         # Set name
         ema.name = f"ema_{period}"
 
-        logger.debug(
-            f"EMA stats: min={ema.min():.4f}, "
-            f"max={ema.max():.4f}, "
-            f"mean={ema.mean():.4f}, "
-            f"first_valid={ema.first_valid_index()}"
-        )
+        # Stats are full passes over the series: only compute them for DEBUG
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "EMA stats: min=%.4f, max=%.4f, mean=%.4f, first_valid=%s",
+                ema.min(),
+                ema.max(),
+                ema.mean(),
+                ema.first_valid_index(),
+            )
 
         return ema
 
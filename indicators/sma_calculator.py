@@ -55,12 +55,15 @@ class SMACalculator(BaseCalculator):
         # Set name
         sma.name = f"sma_{period}"
 
-        logger.debug(
-            f"SMA stats: min={sma.min():.4f}, "
-            f"max={sma.max():.4f}, "
-            f"mean={sma.mean():.4f}, "
-            f"first_valid={sma.first_valid_index()}"
-        )
+        # Stats are full passes over the series: only compute them for DEBUG
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "SMA stats: min=%.4f, max=%.4f, mean=%.4f, first_valid=%s",
+                sma.min(),
+                sma.max(),
+                sma.mean(),
+                sma.first_valid_index(),
+            )
 
         return sma
 
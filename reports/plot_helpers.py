@@ -9,12 +9,44 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
-from matplotlib.patches import Rectangle, FancyBboxPatch
-from typing import Dict, Any, List, Optional
+from matplotlib.patches import FancyBboxPatch
+from matplotlib.collections import LineCollection, PolyCollection
+from typing import Dict, Any, List, Optional, Tuple
 import logging
 
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Trade marker groups larger than this are thinned with LTTB before scatter.
+SCATTER_MAX_POINTS = 5000
+
+
+def dates_to_num(index: pd.DatetimeIndex) -> np.ndarray:
+    """
+    Convert a DatetimeIndex to matplotlib date numbers in one vectorized call.
+
+    Passing the resulting floats to every artist avoids matplotlib running
+    its datetime unit converter again for each plot/scatter/fill call.
+
+    Args:
+        index: DatetimeIndex (tz-aware values are converted to UTC)
+
+    Returns:
+        Float array of days since the matplotlib epoch
+    """
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        # tz_convert(None) yields naive UTC; .values then hands back the
+        # underlying datetime64 buffer instead of boxing via to_numpy()
+        index = index.tz_convert(None)
+    return mdates.date2num(index.values)
+
 
 def plot_candlesticks_basic(
     ax: plt.Axes,
@@ -23,6 +55,8 @@ def plot_candlesticks_basic(
     down_color: str = "#EF5350",
     wick_color: str = "#000000",
     alpha: float = 0.8,
+    dates: Optional[np.ndarray] = None,
+    max_candles: Optional[int] = None,
 ):
     """
     Plot candlesticks using basic matplotlib (no mplfinance dependency).
@@ -34,9 +68,13 @@ def plot_candlesticks_basic(
         down_color: Color for bearish candles
         wick_color: Color for wicks
         alpha: Transparency
+        dates: Optional precomputed matplotlib date numbers of data.index
+        max_candles: If set and exceeded, consecutive bars are merged into
+            this many OHLC candles (first open, max high, min low, last close)
     """
     # Convert timestamps to matplotlib dates
-    dates = mdates.date2num(data.index.to_pydatetime())
+    if dates is None:
+        dates = dates_to_num(data.index)
 
     # Calculate bar width (80% of time interval)
     if len(dates) > 1:
@@ -45,44 +83,66 @@ def plot_candlesticks_basic(
     else:
         width = 0.0003  # Fallback
 
-    # Iterate through candles
-    for i, (idx, row) in enumerate(data.iterrows()):
-        date = dates[i]
-        open_price = row["open"]
-        high_price = row["high"]
-        low_price = row["low"]
-        close_price = row["close"]
-
-        # Determine color
-        color = up_color if close_price >= open_price else down_color
-
-        # Draw wick (high-low line)
-        ax.plot(
-            [date, date],
-            [low_price, high_price],
-            color=wick_color,
-            linewidth=1,
+    opens = data["open"].to_numpy(dtype=np.float64)
+    highs = data["high"].to_numpy(dtype=np.float64)
+    lows = data["low"].to_numpy(dtype=np.float64)
+    closes = data["close"].to_numpy(dtype=np.float64)
+    x_min, x_max = dates[0] - width, dates[-1] + width
+
+    # More bars than pixel columns: merge each run of `step` bars into one
+    # candle (bodies would only overlap); highs/lows of every bar are kept
+    if max_candles and len(dates) > max_candles:
+        step = -(-len(dates) // max_candles)
+        starts = np.arange(0, len(dates), step)
+        lasts = np.minimum(starts + step, len(dates)) - 1
+
+        opens = opens[starts]
+        closes = closes[lasts]
+        highs = np.fmax.reduceat(highs, starts)
+        lows = np.fmin.reduceat(lows, starts)
+        dates = (dates[starts] + dates[lasts]) / 2
+        width *= step
+
+    # Wicks (high-low lines): one collection instead of a Line2D per candle
+    wicks = np.empty((len(dates), 2, 2))
+    wicks[:, :, 0] = dates[:, None]
+    wicks[:, 0, 1] = lows
+    wicks[:, 1, 1] = highs
+    ax.add_collection(
+        LineCollection(
+            wicks,
+            colors=wick_color,
+            linewidths=1,
             alpha=alpha,
-            solid_capstyle="round",
+            capstyle="round",
+            zorder=2,  # above the bodies, as Line2D over patches
         )
+    )
 
-        # Draw body (open-close rectangle)
-        body_height = abs(close_price - open_price)
-        body_bottom = min(open_price, close_price)
-
-        rect = Rectangle(
-            (date - width / 2, body_bottom),
-            width,
-            body_height,
-            facecolor=color,
-            edgecolor=color,
+    # Bodies (open-close rectangles): one PolyCollection, coloured by direction
+    body_bottom = np.minimum(opens, closes)
+    body_top = np.maximum(opens, closes)
+    left = dates - width / 2
+    right = dates + width / 2
+
+    bodies = np.empty((len(dates), 4, 2))
+    bodies[:, :, 0] = np.column_stack([left, right, right, left])
+    bodies[:, :, 1] = np.column_stack([body_bottom, body_bottom, body_top, body_top])
+    body_colors = np.where(closes >= opens, up_color, down_color)
+    ax.add_collection(
+        PolyCollection(
+            bodies,
+            facecolors=body_colors,
+            edgecolors=body_colors,
             alpha=alpha,
-            linewidth=0.5,
+            linewidths=0.5,
+            zorder=1,
         )
-        ax.add_patch(rect)
+    )
+    ax.autoscale_view()
 
     # Set limits with padding
-    ax.set_xlim(dates[0] - width, dates[-1] + width)
+    ax.set_xlim(x_min, x_max)
 
     price_range = data["high"].max() - data["low"].min()
     ax.set_ylim(
@@ -90,81 +150,186 @@ def plot_candlesticks_basic(
     )
 
 
+def parse_trade_times(
+    trades: List[Dict[str, Any]],
+) -> Tuple[pd.DatetimeIndex, pd.DatetimeIndex]:
+    """
+    Parse entry/exit timestamps of all trades in one vectorized call.
+
+    Strings, Timestamps and datetimes are handled alike; missing or
+    unparseable values (e.g. the exit of a still-open trade) become NaT.
+
+    Args:
+        trades: List of trade dictionaries
+
+    Returns:
+        Tuple of (entry_times, exit_times) as DatetimeIndex
+    """
+    entry_times = _to_datetime_index([trade.get("entry_time") for trade in trades])
+    exit_times = _to_datetime_index([trade.get("exit_time") for trade in trades])
+    return entry_times, exit_times
+
+
+def _to_datetime_index(values: List[Any]) -> pd.DatetimeIndex:
+    """Build a DatetimeIndex, skipping format inference for Timestamp input."""
+    # The engine stores pd.Timestamp objects (None/NaT for open trades); those
+    # can go straight into DatetimeIndex, roughly 2x faster than to_datetime
+    if all(
+        value is None or value is pd.NaT or isinstance(value, pd.Timestamp)
+        for value in values
+    ):
+        try:
+            return pd.DatetimeIndex(values)
+        except (TypeError, ValueError):
+            pass  # e.g. mixed timezones
+
+    return pd.to_datetime(values, errors="coerce")
+
+
+def records_to_array(
+    records: List[Dict[str, Any]],
+    key: str,
+    default: float = np.nan,
+) -> np.ndarray:
+    """
+    Pull one numeric field out of a list of dicts as a float64 array.
+
+    Cheaper than building a DataFrame from the whole list when only a few
+    columns are needed.
+
+    Args:
+        records: List of dictionaries (trades, equity points, ...)
+        key: Field to extract
+        default: Value used where the field is missing or None
+
+    Returns:
+        1-D float64 array, one element per record
+    """
+    return np.fromiter(
+        (
+            default if (value := record.get(key)) is None else value
+            for record in records
+        ),
+        dtype=np.float64,
+        count=len(records),
+    )
+
+
 def plot_trades_markers(
     ax: plt.Axes,
     data: pd.DataFrame,
     trades: List[Dict[str, Any]],
     show_pnl: bool = True,
+    trade_times: Optional[Tuple[pd.DatetimeIndex, pd.DatetimeIndex]] = None,
 ):
     """Plot entry and exit markers for trades."""
-    for trade in trades:
-        entry_time = pd.to_datetime(trade["entry_time"])
-        exit_time = pd.to_datetime(trade["exit_time"])
-        entry_price = trade["entry_price"]
-        exit_price = trade["exit_price"]
-
-        # FIX: Use 'position_type' field (lowercase values)
-        position_type = trade.get("position_type", "long")  # ← Correct field name
-        direction = position_type.upper()  # ← Convert to uppercase for display
-
-        pnl_pct = trade.get("net_pnl_percent", 0)
-
-        # Colors based on direction
-        if direction == "LONG":
-            entry_color = "#27AE60"
-            entry_marker = "^"
-            exit_marker = "v"
-        else:  # SHORT
-            entry_color = "#E74C3C"
-            entry_marker = "v"
-            exit_marker = "^"
-
-        # Exit color based on P&L
-        exit_color = "#27AE60" if pnl_pct > 0 else "#E74C3C"
-
-        # Plot entry marker
-        ax.scatter(
-            entry_time,
-            entry_price,
-            marker=entry_marker,
-            s=100,
-            color=entry_color,
-            edgecolors="black",
-            linewidths=1.5,
+    if trade_times is None:
+        trade_times = parse_trade_times(trades)
+
+    # Matplotlib date numbers (NaT -> NaN), converted once for all artists
+    entry_times, exit_times = (dates_to_num(times) for times in trade_times)
+
+    # Column-wise trade fields (one pass, no per-trade artists)
+    entry_prices = records_to_array(trades, "entry_price")
+    exit_prices = records_to_array(trades, "exit_price")
+    pnl_pcts = records_to_array(trades, "net_pnl_percent", default=0.0)
+    # FIX: Use 'position_type' field (lowercase values)
+    is_long = np.array(
+        [trade.get("position_type", "long").upper() == "LONG" for trade in trades],
+        dtype=bool,
+    )
+
+    # Exit color based on P&L
+    exit_colors = np.where(pnl_pcts > 0, "#27AE60", "#E74C3C")
+
+    # Very long runs: thin each marker group with LTTB (~2 points per pixel
+    # of the price axes). Only the marker layer is thinned; every closed
+    # trade keeps its P&L label.
+    n_out = max(2000, int(ax.get_window_extent().width * 2))
+    has_exit = ~(np.isnan(exit_times) | np.isnan(exit_prices))
+    labelled = []
+    n_dropped = 0
+
+    # One scatter per (direction, side): LONG enters ^ exits v, SHORT the opposite
+    for mask, entry_marker, exit_marker, entry_color in (
+        (is_long, "^", "v", "#27AE60"),
+        (~is_long, "v", "^", "#E74C3C"),
+    ):
+        if not mask.any():
+            continue
+
+        entry_idx = np.flatnonzero(mask)
+        exit_idx = np.flatnonzero(mask & has_exit)
+        labelled.append(exit_idx)
+        if len(entry_idx) > SCATTER_MAX_POINTS:
+            kept = lttb_indices(entry_times[entry_idx], entry_prices[entry_idx], n_out)
+            n_dropped += len(entry_idx) - len(kept)
+            entry_idx = entry_idx[kept]
+        if len(exit_idx) > SCATTER_MAX_POINTS:
+            kept = lttb_indices(exit_times[exit_idx], exit_prices[exit_idx], n_out)
+            n_dropped += len(exit_idx) - len(kept)
+            exit_idx = exit_idx[kept]
+
+        # Markers share one style per group, so the Line2D marker path
+        # (no per-point size/colour mapping) replaces scatter. Exits are
+        # split by outcome to keep their win/loss colours.
+        marker_style = dict(
+            linestyle="None",
+            markersize=10,  # scatter s=100
+            markeredgecolor="black",
+            markeredgewidth=1.5,
             zorder=10,
             alpha=0.9,
         )
 
-        # Plot exit marker
-        ax.scatter(
-            exit_time,
-            exit_price,
-            marker=exit_marker,
-            s=100,
-            color=exit_color,
-            edgecolors="black",
-            linewidths=1.5,
-            zorder=10,
-            alpha=0.9,
+        # Plot entry markers
+        ax.plot(
+            entry_times[entry_idx],
+            entry_prices[entry_idx],
+            marker=entry_marker,
+            color=entry_color,
+            **marker_style,
+        )
+
+        # Plot exit markers
+        for exit_color in ("#27AE60", "#E74C3C"):
+            color_idx = exit_idx[exit_colors[exit_idx] == exit_color]
+            if len(color_idx) == 0:
+                continue
+            ax.plot(
+                exit_times[color_idx],
+                exit_prices[color_idx],
+                marker=exit_marker,
+                color=exit_color,
+                **marker_style,
+            )
+
+    if n_dropped:
+        logger.warning(
+            "Trade markers thinned for the price chart: %d of %d markers not drawn",
+            n_dropped,
+            len(trades) + int(np.count_nonzero(has_exit)),
         )
 
-        # Add P&L label if enabled
-        if show_pnl:
+    # Add P&L labels if enabled (text artists cannot be batched); every
+    # closed trade gets one, whether or not its marker survived thinning
+    if show_pnl and labelled:
+        for i in np.sort(np.concatenate(labelled)):
             # Position label above/below based on direction
-            y_offset = 20 if direction == "LONG" else -20
+            y_offset = 20 if is_long[i] else -20
 
             ax.annotate(
-                f"{pnl_pct:+.2f}%",
-                xy=(exit_time, exit_price),
+                f"{pnl_pcts[i]:+.2f}%",
+                xy=(exit_times[i], exit_prices[i]),
                 xytext=(0, y_offset),
                 textcoords="offset points",
                 fontsize=7,
-                color=exit_color,
+                color=exit_colors[i],
                 fontweight="bold",
                 bbox=dict(
                     boxstyle="round,pad=0.3",
                     facecolor="white",
-                    edgecolor=exit_color,
+                    edgecolor=exit_colors[i],
                     alpha=0.8,
                     linewidth=1.5,
                 ),
@@ -172,109 +337,308 @@ def plot_trades_markers(
             )
 
 
+# Row of NaN (x, y1, y2) separating trades in the batched zone fills
+_NAN_ROW = np.full((1, 3), np.nan)
+
+
 def plot_sl_tp_zones(
     ax: plt.Axes,
     data: pd.DataFrame,
     trades: List[Dict[str, Any]],
     sl_tp_config: Dict[str, Any],
+    trade_times: Optional[Tuple[pd.DatetimeIndex, pd.DatetimeIndex]] = None,
+    x_num: Optional[np.ndarray] = None,
 ):
     """
     Plot dynamic TP/SL zones.
+
+    All TP lines go into one LineCollection and all SL lines into another,
+    instead of two Line2D artists per trade.
     """
     style = sl_tp_config.get("style", {})
+    tp_color = style.get("tp_color", "#27AE60")
+    sl_color = style.get("sl_color", "#E74C3C")
+
+    if trade_times is None:
+        trade_times = parse_trade_times(trades)
+    entry_times, exit_times = trade_times
+    if x_num is None:
+        x_num = dates_to_num(data.index)
+
+    # Locate every trade's [entry, exit] bar range with one binary search
+    starts = data.index.searchsorted(entry_times, side="left")
+    ends = data.index.searchsorted(exit_times, side="right")
+    tp_values = data["take_profit"].to_numpy(dtype=np.float64)
+    sl_values = data["stop_loss"].to_numpy(dtype=np.float64)
+
+    tp_segments = []
+    sl_segments = []
+    tp_fill = []
+    sl_fill = []
+    fill_zones = style.get("fill_zones", True)
+    zone_alpha = style.get("zone_alpha", 0.1)
+
+    for trade, start, end in zip(trades, starts, ends):
+        if start >= end:
+            continue
 
-    for trade in trades:
-        entry_time = pd.to_datetime(trade["entry_time"])
-        exit_time = pd.to_datetime(trade["exit_time"])
-
-        # Get trade data
-        mask = (data.index >= entry_time) & (data.index <= exit_time)
-        trade_data = data.loc[mask]
+        # Get TP/SL values (NaN-free, like Series.dropna())
+        x_trade = x_num[start:end]
+        tp_trade = tp_values[start:end]
+        sl_trade = sl_values[start:end]
+        tp_valid = ~np.isnan(tp_trade)
+        sl_valid = ~np.isnan(sl_trade)
 
-        if trade_data.empty:
+        if not tp_valid.any() or not sl_valid.any():
             continue
 
-        # Get TP/SL series
-        tp_series = trade_data["take_profit"].dropna()
-        sl_series = trade_data["stop_loss"].dropna()
+        tp_x, tp_y = x_trade[tp_valid], tp_trade[tp_valid]
+        sl_x, sl_y = x_trade[sl_valid], sl_trade[sl_valid]
+        tp_segments.append(np.column_stack([tp_x, tp_y]))
+        sl_segments.append(np.column_stack([sl_x, sl_y]))
+
+        # Fill zones: the TP/SL level clipped at the entry price, so the side
+        # of entry it must not cross gets zero height (no where= masks)
+        if fill_zones:
+            entry_price = trade["entry_price"]
+            if trade.get("position_type", "long") == "long":
+                tp_bound = np.maximum(tp_y, entry_price)
+                sl_bound = np.minimum(sl_y, entry_price)
+            else:
+                tp_bound = np.minimum(tp_y, entry_price)
+                sl_bound = np.maximum(sl_y, entry_price)
+
+            # NaN separators keep trades apart (fill_between splits on NaN)
+            tp_fill.append(
+                np.column_stack([tp_x, np.full_like(tp_x, entry_price), tp_bound])
+            )
+            sl_fill.append(
+                np.column_stack([sl_x, np.full_like(sl_x, entry_price), sl_bound])
+            )
+            tp_fill.append(_NAN_ROW)
+            sl_fill.append(_NAN_ROW)
 
-        if tp_series.empty or sl_series.empty:
+    # TP and SL zones: one fill_between each instead of two per trade
+    for pieces, color in ((tp_fill, tp_color), (sl_fill, sl_color)):
+        if not pieces:
             continue
+        zone = np.concatenate(pieces)
+        ax.fill_between(
+            zone[:, 0],
+            zone[:, 1],
+            zone[:, 2],
+            color=color,
+            alpha=zone_alpha,
+            linewidth=0,
+            zorder=2,
+        )
 
-        # Plot TP line
-        ax.plot(
-            tp_series.index,
-            tp_series.values,
-            color=style.get("tp_color", "#27AE60"),
-            linestyle=style.get("line_style", "--"),
-            linewidth=style.get("line_width", 1.5),
-            alpha=0.8,
-            label="Take Profit" if trade == trades[0] else "",
-            zorder=5,
+    # TP and SL lines: one collection each
+    for segments, color, label in (
+        (tp_segments, tp_color, "Take Profit"),
+        (sl_segments, sl_color, "Stop Loss"),
+    ):
+        if not segments:
+            continue
+        ax.add_collection(
+            LineCollection(
+                segments,
+                colors=color,
+                linestyles=style.get("line_style", "--"),
+                linewidths=style.get("line_width", 1.5),
+                alpha=0.8,
+                label=label,
+                zorder=5,
+            )
         )
 
-        # Plot SL line
-        ax.plot(
-            sl_series.index,
-            sl_series.values,
-            color=style.get("sl_color", "#E74C3C"),
-            linestyle=style.get("line_style", "--"),
-            linewidth=style.get("line_width", 1.5),
-            alpha=0.8,
-            label="Stop Loss" if trade == trades[0] else "",
-            zorder=5,
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, parallel=True)
+    def _m4_bins(y, starts, ends, out_idx):
+        """Fill out_idx[b] with (first, argmin, argmax, last) of bucket b."""
+        for b in prange(len(starts)):
+            start = starts[b]
+            end = ends[b]
+            min_i = start
+            max_i = start
+            min_v = np.inf
+            max_v = -np.inf
+
+            # NaN compares False, so it is skipped like np.fmin/np.fmax
+            for i in range(start, end):
+                v = y[i]
+                if v < min_v:
+                    min_v = v
+                    min_i = i
+                if v > max_v:
+                    max_v = v
+                    max_i = i
+
+            out_idx[b, 0] = start
+            out_idx[b, 1] = min_i
+            out_idx[b, 2] = max_i
+            out_idx[b, 3] = end - 1
+
+
+def m4_downsample(
+    x: Any,
+    y: Any,
+    n_pixels: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Downsample a line series with M4 aggregation.
+
+    Splits the series into one bucket per horizontal pixel and keeps only the
+    first, last, min and max point of each bucket. The rasterized line is
+    pixel-identical to the full series while the vertex count drops to at
+    most 4 * n_pixels (Jugel et al., "M4: A Visualization-Oriented Time
+    Series Data Aggregation", VLDB 2014).
+
+    Uses a Numba kernel when numba is installed, NumPy otherwise.
+
+    Args:
+        x: X values (array-like, e.g. DatetimeIndex)
+        y: Y values (array-like, NaN allowed; float32/float64 kept as-is)
+        n_pixels: Horizontal resolution of the rendered axis
+
+    Returns:
+        Tuple of (x, y) arrays; unchanged if already small enough
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if not np.issubdtype(y.dtype, np.floating):
+        y = y.astype(np.float64)
+    n = len(y)
+
+    if n_pixels <= 0 or n <= 4 * n_pixels:
+        return x, y
+
+    starts = np.linspace(0, n, n_pixels + 1).astype(np.int64)[:-1]
+    ends = np.append(starts[1:], n)
+
+    if NUMBA_AVAILABLE:
+        # Single fused pass per bucket, buckets processed in parallel
+        out_idx = np.empty((n_pixels, 4), dtype=np.int64)
+        _m4_bins(y, starts, ends, out_idx)
+        keep = np.unique(out_idx)
+        return x[keep], y[keep]
+
+    bin_ids = np.repeat(np.arange(n_pixels), ends - starts)
+
+    # fmin/fmax ignore NaN unless the whole bucket is NaN
+    mins = np.fmin.reduceat(y, starts)
+    maxs = np.fmax.reduceat(y, starts)
+
+    min_pos = np.flatnonzero(y == mins[bin_ids])
+    max_pos = np.flatnonzero(y == maxs[bin_ids])
+    _, first_min = np.unique(bin_ids[min_pos], return_index=True)
+    _, first_max = np.unique(bin_ids[max_pos], return_index=True)
+
+    keep = np.unique(
+        np.concatenate([starts, ends - 1, min_pos[first_min], max_pos[first_max]])
+    )
+
+    return x[keep], y[keep]
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _drawdown_pass(equity, peak, drawdown):
+        """Running peak and % drawdown in one sequential pass."""
+        running = equity[0]
+        for i in range(len(equity)):
+            v = equity[i]
+            # NaN propagates into the peak, as with np.maximum.accumulate
+            if v > running or v != v:
+                running = v
+            peak[i] = running
+            drawdown[i] = (v - running) / running * 100.0 if running != 0 else 0.0
+
+
+def drawdown_percent(equity: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the running peak and percentage drawdown of an equity curve.
+
+    Uses a fused Numba pass when numba is installed (no temporaries), NumPy
+    otherwise. Where the peak is 0 the drawdown is reported as 0.
+
+    Args:
+        equity: 1-D float64 equity values
+
+    Returns:
+        Tuple of (peak, drawdown) float64 arrays; drawdown is <= 0 in percent
+    """
+    equity = np.ascontiguousarray(equity, dtype=np.float64)
+    peak = np.empty_like(equity)
+    drawdown = np.zeros_like(equity)
+    if equity.size == 0:
+        return peak, drawdown
+
+    if NUMBA_AVAILABLE:
+        _drawdown_pass(equity, peak, drawdown)
+        return peak, drawdown
+
+    # Single preallocated buffer, in-place NumPy ops
+    np.maximum.accumulate(equity, out=peak)
+    has_peak = peak != 0
+    np.subtract(equity, peak, out=drawdown, where=has_peak)
+    np.divide(drawdown, peak, out=drawdown, where=has_peak)
+    drawdown *= 100.0
+    return peak, drawdown
+
+
+def lttb_indices(x: Any, y: Any, n_out: int) -> np.ndarray:
+    """
+    Pick n_out representative points with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last point; from each bucket in between keeps the
+    point forming the largest triangle with the previously kept point and the
+    average of the next bucket (Steinarsson, "Downsampling Time Series for
+    Visual Representation", 2013). Suited to scatter markers, where M4's
+    per-pixel min/max does not apply.
+
+    Args:
+        x: X values (sorted ascending, no NaN)
+        y: Y values (no NaN)
+        n_out: Number of points to keep
+
+    Returns:
+        Sorted integer indices into x/y; all indices if already small enough
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # n_out - 2 buckets between the fixed first and last point
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    edges = np.append(edges, n)
+
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = n - 1
+
+    a = 0
+    for b in range(n_out - 2):
+        start, end = edges[b], edges[b + 1]
+        next_end = edges[b + 2]
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        # Twice the triangle area (the constant factor does not matter)
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
         )
+        a = start + int(area.argmax())
+        keep[b + 1] = a
 
-        # Fill zones
-        if style.get("fill_zones", True):
-            entry_price = trade["entry_price"]
-            position_type = trade.get("position_type", "long")
-
-            if position_type == "long":  # LONG
-                # Zone TP
-                ax.fill_between(
-                    tp_series.index,
-                    entry_price,
-                    tp_series.values,
-                    where=(tp_series.values > entry_price),
-                    color=style.get("tp_color", "#27AE60"),
-                    alpha=style.get("zone_alpha", 0.1),
-                    zorder=2,
-                )
-
-                # Zone SL
-                ax.fill_between(
-                    sl_series.index,
-                    sl_series.values,
-                    entry_price,
-                    where=(sl_series.values < entry_price),
-                    color=style.get("sl_color", "#E74C3C"),
-                    alpha=style.get("zone_alpha", 0.1),
-                    zorder=2,
-                )
-
-            else:  # SHORT
-                # Zone TP green belove
-                ax.fill_between(
-                    tp_series.index,
-                    tp_series.values,
-                    entry_price,
-                    where=(tp_series.values < entry_price),
-                    color=style.get("tp_color", "#27AE60"),
-                    alpha=style.get("zone_alpha", 0.1),
-                    zorder=2,
-                )
-
-                # Zone SL red above
-                ax.fill_between(
-                    sl_series.index,
-                    entry_price,
-                    sl_series.values,
-                    where=(sl_series.values > entry_price),
-                    color=style.get("sl_color", "#E74C3C"),
-                    alpha=style.get("zone_alpha", 0.1),
-                    zorder=2,
-                )
+    return keep
 
 
 def format_date_axis(ax: plt.Axes):
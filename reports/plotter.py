@@ -7,11 +7,22 @@ Supports dynamic panel creation, overlay indicators, and visual customization.
 
 import pandas as pd
 import numpy as np
+import matplotlib
+
+# Plots are only ever saved to PNG: use the non-interactive Agg backend
+matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+import matplotlib.colors as mcolors
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 from matplotlib.patches import Rectangle
 from matplotlib.gridspec import GridSpec
+import os
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Dict, Any, List, Tuple, Optional
 import logging
 
@@ -24,15 +35,59 @@ except ImportError:
     logging.warning("mplfinance not available. Candlestick plotting will be limited.")
 
 from reports.plot_helpers import (
+    dates_to_num,
+    parse_trade_times,
     plot_candlesticks_basic,
     plot_trades_markers,
     plot_sl_tp_zones,
     format_date_axis,
     add_text_box,
+    m4_downsample,
+    drawdown_percent,
+    lttb_indices,
+    records_to_array,
+    SCATTER_MAX_POINTS,
 )
 
 logger = logging.getLogger(__name__)
 
+# Speed up Agg rasterization of long line series (equity, indicators)
+plt.rcParams["path.simplify"] = True
+plt.rcParams["path.simplify_threshold"] = 1.0
+plt.rcParams["agg.path.chunksize"] = 10000
+
+# Default resolution used when saving plots (plot_config.dpi overrides it)
+SAVE_DPI = 150
+
+# PNG encoder settings: zlib level 3 instead of 6 cuts encode time (~15% of
+# savefig on a line-art figure) for files ~20% larger
+SAVE_PIL_KWARGS = {"compress_level": 3}
+
+# Default for plot_config.parallel_min_bars: build the plots in worker
+# processes once the price data is this long (and more than one CPU is
+# available). Not benchmarked: tune it per machine in config.yaml
+PARALLEL_MIN_BARS = 50_000
+
+_STYLE_APPLIED = False
+
+
+def _ensure_style():
+    """Apply the matplotlib style sheet once per process."""
+    global _STYLE_APPLIED
+    if not _STYLE_APPLIED:
+        plt.style.use("seaborn-v0_8-darkgrid")
+        _STYLE_APPLIED = True
+
+
+def _run_plot_job(method_name: str, kwargs: Dict) -> Path:
+    """
+    Worker-process entry point: run one BacktestPlotter.create_* method.
+
+    The plotter is built in the worker (it only holds colours), so just
+    the job's own inputs are pickled, not the parent's plotter.
+    """
+    return getattr(BacktestPlotter(), method_name)(**kwargs)
+
 
 class BacktestPlotter:
     """
@@ -50,8 +105,8 @@ class BacktestPlotter:
 
     def __init__(self):
         """Initialize plotter with default style settings."""
-        # Set matplotlib style
-        plt.style.use("seaborn-v0_8-darkgrid")
+        # Set matplotlib style (parsed only on first plotter creation)
+        _ensure_style()
 
         # Default colors
         self.colors = {
@@ -107,45 +162,138 @@ class BacktestPlotter:
             plot_data = full_data_df
             logger.info(f"Using original data for plotting (no TP/SL columns)")
 
-        # 1. Price signals (main chart)
-        try:
-            logger.info("Creating price_signals.png...")
-            path = self.create_price_signals(
-                data=plot_data,
-                trades=results.get("trades", []),
-                config=config,
-                save_path=run_dir / "price_signals.png",
+        trades = results.get("trades", [])
+        equity_data = results.get("equity_curve", [])
+
+        # 1. Price signals (main chart), optionally skipped for tiny runs
+        jobs = {}
+        min_trades = config.get("plot_config", {}).get("price_min_trades", 0)
+        if len(trades) >= min_trades:
+            jobs["price_signals"] = (
+                "create_price_signals",
+                dict(
+                    data=plot_data,
+                    trades=trades,
+                    config=config,
+                    save_path=run_dir / "price_signals.png",
+                ),
             )
-            plot_paths["price_signals"] = path
-        except Exception as e:
-            logger.error(f"Failed to create price signals plot: {e}", exc_info=True)
-
-        # 2. Equity curve
-        try:
-            logger.info("Creating equity_curve.png...")
-            path = self.create_equity_curve(
-                equity_data=results.get("equity_curve", []),
-                trades=results.get("trades", []),
-                config=config,
-                save_path=run_dir / "equity_curve.png",
-            )
-            plot_paths["equity_curve"] = path
-        except Exception as e:
-            logger.error(f"Failed to create equity curve plot: {e}", exc_info=True)
-
-        # 3. Trade distribution
-        try:
-            logger.info("Creating trade_distribution.png...")
-            path = self.create_trade_distribution(
-                trades=results.get("trades", []),
-                config=config,
-                save_path=run_dir / "trade_distribution.png",
+        else:
+            logger.info(
+                "Skipping price chart: %d trades < price_min_trades (%d)",
+                len(trades),
+                min_trades,
             )
-            plot_paths["trade_distribution"] = path
-        except Exception as e:
-            logger.error(
-                f"Failed to create trade distribution plot: {e}", exc_info=True
+
+        # 2./3. Equity curve + trade distribution (separate files)
+        stats_jobs = {
+            "equity_curve": (
+                "create_equity_curve",
+                dict(
+                    equity_data=equity_data,
+                    trades=trades,
+                    config=config,
+                    save_path=run_dir / "equity_curve.png",
+                ),
+            ),
+            "trade_distribution": (
+                "create_trade_distribution",
+                dict(
+                    trades=trades,
+                    config=config,
+                    save_path=run_dir / "trade_distribution.png",
+                ),
+            ),
+        }
+
+        # Optional: equity + distribution combined on one figure
+        use_dashboard = config.get("plot_config", {}).get("dashboard", False)
+        if use_dashboard:
+            jobs["dashboard"] = (
+                "create_dashboard",
+                dict(
+                    equity_data=equity_data,
+                    trades=trades,
+                    config=config,
+                    save_path=run_dir / "dashboard.png",
+                ),
             )
+        else:
+            jobs.update(stats_jobs)
+
+        # Large runs: build the figures in parallel worker processes
+        min_bars = config.get("plot_config", {}).get(
+            "parallel_min_bars", PARALLEL_MIN_BARS
+        )
+        parallel = len(plot_data) >= min_bars
+        plot_paths.update(self._run_plot_jobs(jobs, parallel))
+
+        # Dashboard failed: fall back to the separate plots
+        if use_dashboard and plot_paths.get("dashboard") is None:
+            plot_paths.pop("dashboard", None)
+            plot_paths.update(self._run_plot_jobs(stats_jobs, parallel))
+
+        return plot_paths
+
+    def _run_plot_jobs(
+        self, jobs: Dict[str, Tuple[str, Dict[str, Any]]], parallel: bool
+    ) -> Dict[str, Path]:
+        """
+        Run plot jobs serially or in a process pool.
+
+        Figures share no state once their input data is prepared, so each
+        job (figure build + PNG encode) can run in its own process.
+
+        Args:
+            jobs: Mapping of plot name -> (method name, keyword arguments)
+            parallel: Use a ProcessPoolExecutor (one worker per job, capped at
+                the CPU count; serial when only one CPU is available)
+
+        Returns:
+            Mapping of plot name -> saved path (failed plots are logged, omitted;
+            jobs that fail in the pool are retried serially first)
+        """
+        plot_paths = {}
+
+        # One worker per job, but never more workers than CPUs: on a
+        # single-CPU host the pool only adds start-up and pickling cost
+        workers = min(len(jobs), os.cpu_count() or 1)
+
+        if parallel and workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = {}
+                    for name, (method_name, kwargs) in jobs.items():
+                        logger.info("Creating %s.png (worker process)...", name)
+                        futures[name] = pool.submit(_run_plot_job, method_name, kwargs)
+
+                    for name, future in futures.items():
+                        if future.exception() is None:
+                            plot_paths[name] = future.result()
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning("Process pool failed: %s", e)
+
+            # Anything without a saved path (worker error, crashed pool) is
+            # replotted serially below, where its error is logged
+            jobs = {name: job for name, job in jobs.items() if name not in plot_paths}
+            if jobs:
+                logger.warning(
+                    "Plotting %d job(s) serially after worker failure: %s",
+                    len(jobs),
+                    ", ".join(jobs),
+                )
+
+        for name, (method_name, kwargs) in jobs.items():
+            try:
+                logger.info("Creating %s.png...", name)
+                plot_paths[name] = getattr(self, method_name)(**kwargs)
+            except Exception as e:
+                logger.error(
+                    "Failed to create %s plot: %s",
+                    name.replace("_", " "),
+                    e,
+                    exc_info=True,
+                )
 
         return plot_paths
 
@@ -174,10 +322,15 @@ class BacktestPlotter:
         Returns:
             Path to saved plot
         """
+        if data.empty:
+            logger.warning("No price data to plot")
+            return None
+
         # Extract plot config
         plot_config = config.get("plot_config", {})
         layout = plot_config.get("layout", {})
         style = plot_config.get("style", {})
+        dpi = plot_config.get("dpi", SAVE_DPI)
 
         # Get height ratios
         price_ratio = layout.get("price_height_ratio", 3)
@@ -229,41 +382,81 @@ class BacktestPlotter:
         # --- PANEL 0: Price Chart ---
         ax_price = axes[0]
 
-        # Plot candlesticks
+        # Convert the shared x-axis to matplotlib date numbers once; all
+        # artists get plain floats and the axis keeps date formatting
+        x_num = dates_to_num(data.index)
+        ax_price.xaxis_date()
+
+        # Horizontal resolution of the saved figure (for M4 downsampling)
+        n_pixels = int(fig_width * dpi)
+
+        # Plot candlesticks (merged into at most one candle per pixel column)
         candle_colors = style.get("candlestick", {})
         plot_candlesticks_basic(
             ax_price,
             data,
             up_color=candle_colors.get("up_color", self.colors["candle_up"]),
             down_color=candle_colors.get("down_color", self.colors["candle_down"]),
+            dates=x_num,
+            max_candles=n_pixels,
         )
 
-        # Plot overlay indicators
+        # Plot overlay indicators as a single LineCollection (one draw call
+        # for all overlays); Line2D proxies stand in for them in the legend
+        overlay_segments = []
+        overlay_styles = {"colors": [], "linewidths": []}
+        overlay_handles = []
         for ind_info in overlays:
             col_name = ind_info["column"]
             if col_name in data.columns:
-                ax_price.plot(
-                    data.index,
-                    data[col_name],
-                    label=ind_info["label"],
-                    color=ind_info["color"],
-                    linewidth=ind_info.get("linewidth", 1.5),
-                    alpha=ind_info.get("alpha", 0.8),
+                x_ind, y_ind = m4_downsample(x_num, ind_info["values"], n_pixels)
+                overlay_segments.append(np.column_stack([x_ind, y_ind]))
+                linewidth = ind_info.get("linewidth", 1.5)
+                alpha = ind_info.get("alpha", 0.8)
+                overlay_styles["colors"].append(
+                    mcolors.to_rgba(ind_info["color"], alpha)
                 )
-                logger.debug(f"Plotted overlay: {col_name}")
+                overlay_styles["linewidths"].append(linewidth)
+                overlay_handles.append(
+                    Line2D(
+                        [],
+                        [],
+                        label=ind_info["label"],
+                        color=ind_info["color"],
+                        linewidth=linewidth,
+                        alpha=alpha,
+                    )
+                )
+                logger.debug("Plotted overlay: %s", col_name)
             else:
                 logger.warning(f"Column {col_name} not found in data")
 
+        if overlay_segments:
+            ax_price.add_collection(
+                LineCollection(
+                    overlay_segments,
+                    colors=overlay_styles["colors"],
+                    linewidths=overlay_styles["linewidths"],
+                    zorder=2,
+                )
+            )
+            ax_price.autoscale_view()
+
+        # Parse trade timestamps once, shared by zones, markers and timeline
+        trade_times = parse_trade_times(trades) if trades else None
+
         # Plot SL/TP zones
         exit_visual = config.get("strategy", {}).get("exit", {}).get("visual", {})
         sl_tp_config = exit_visual.get("sl_tp", {})
 
         # DEBUG
-        logger.info(f"SL/TP config found: {sl_tp_config}")
-        logger.info(f"SL/TP enabled: {sl_tp_config.get('enabled', False)}")
+        logger.info("SL/TP config found: %s", sl_tp_config)
+        logger.info("SL/TP enabled: %s", sl_tp_config.get("enabled", False))
         if trades:
             logger.info(
-                f"First trade has TP/SL: {trades[0].get('take_profit')}, {trades[0].get('stop_loss')}"
+                "First trade has TP/SL: %s, %s",
+                trades[0].get("take_profit"),
+                trades[0].get("stop_loss"),
             )
 
         if sl_tp_config.get("enabled", False) and trades:
@@ -273,6 +466,8 @@ class BacktestPlotter:
                     data,
                     trades,
                     sl_tp_config,
+                    trade_times=trade_times,
+                    x_num=x_num,
                 )
                 logger.info("Plotted dynamic TP/SL zones")
             else:
@@ -281,18 +476,25 @@ class BacktestPlotter:
         # Plot trade markers
         if trades:
             # DEBUG: Print first trade structure
-            logger.info(f"First trade keys: {trades[0].keys()}")
-            logger.info(f"First trade: {trades[0]}")
+            logger.info("First trade keys: %s", trades[0].keys())
+            logger.info("First trade: %s", trades[0])
             plot_trades_markers(
                 ax_price,
                 data,
                 trades,
                 show_pnl=sl_tp_config.get("annotations", {}).get("show_pnl", True),
+                trade_times=trade_times,
             )
 
         # Style price chart
         ax_price.set_ylabel("Price", fontsize=10, fontweight="bold")
-        ax_price.legend(loc="upper left", fontsize=8, framealpha=0.9)
+        handles, _ = ax_price.get_legend_handles_labels()
+        ax_price.legend(
+            handles=overlay_handles + handles,
+            loc="upper left",
+            fontsize=8,
+            framealpha=0.9,
+        )
         ax_price.grid(
             True,
             alpha=style.get("grid_alpha", 0.2),
@@ -310,9 +512,10 @@ class BacktestPlotter:
                 continue
 
             # Plot indicator
+            x_ind, y_ind = m4_downsample(x_num, panel_info["values"], n_pixels)
             ax_panel.plot(
-                data.index,
-                data[col_name],
+                x_ind,
+                y_ind,
                 label=panel_info["label"],
                 color=panel_info["color"],
                 linewidth=panel_info.get("linewidth", 1.5),
@@ -369,7 +572,7 @@ class BacktestPlotter:
 
         # --- LAST PANEL: Position Timeline ---
         ax_position = axes[-1]
-        self._plot_position_timeline(ax_position, data, trades)
+        self._plot_position_timeline(ax_position, data, trades, trade_times, x_num)
 
         ax_position.set_ylabel("Position", fontsize=9, fontweight="bold")
         ax_position.set_ylim(-1.5, 1.5)
@@ -399,8 +602,10 @@ class BacktestPlotter:
             y=0.98,
         )
 
-        # Save
-        plt.savefig(save_path, dpi=150, bbox_inches="tight", facecolor=bg_color)
+        # Save (GridSpec margins are fixed: skip the tight-bbox extra draw)
+        plt.savefig(
+            save_path, dpi=dpi, facecolor=bg_color, pil_kwargs=SAVE_PIL_KWARGS
+        )
         plt.close(fig)
 
         logger.info(f"✅ Saved price_signals.png")
@@ -418,31 +623,22 @@ class BacktestPlotter:
             logger.warning("No equity data to plot")
             return None
 
-        # Convert to DataFrame
-        df = pd.DataFrame(equity_data)
-
-        # Handle index (equity data has 'index' field, not timestamp)
-        if "index" in df.columns:
-            df = df.set_index("index")
-
         # FIX: Use 'equity' field (not 'total_equity')
         equity_col = "equity"  # ← Exact field name from engine
 
-        if equity_col not in df.columns:
+        if equity_col not in equity_data[0]:
             logger.error(
-                f"Cannot find '{equity_col}' column. Available: {df.columns.tolist()}"
+                f"Cannot find '{equity_col}' column. "
+                f"Available: {list(equity_data[0].keys())}"
             )
             return None
 
         logger.debug(f"Using equity column: {equity_col}")
 
-        # Calculate drawdown
-        df["peak"] = df[equity_col].cummax()
-        df["drawdown"] = (df[equity_col] - df["peak"]) / df["peak"] * 100
-
         # Create figure
         plot_config = config.get("plot_config", {})
         style = plot_config.get("style", {})
+        dpi = plot_config.get("dpi", SAVE_DPI)
         bg_color = style.get("background_color", self.colors["background"])
 
         fig, (ax_equity, ax_dd) = plt.subplots(
@@ -457,18 +653,238 @@ class BacktestPlotter:
         ax_equity.set_facecolor(bg_color)
         ax_dd.set_facecolor(bg_color)
 
+        n_pixels = int(fig.get_size_inches()[0] * dpi)
+        self._plot_equity_on(
+            ax_equity, ax_dd, equity_data, trades, equity_col, n_pixels
+        )
+
+        # Save (fixed margins: no layout solver, no tight-bbox extra draw)
+        fig.subplots_adjust(
+            left=0.07, right=0.98, top=0.94, bottom=0.07, hspace=0.08
+        )
+        plt.savefig(
+            save_path, dpi=dpi, facecolor=bg_color, pil_kwargs=SAVE_PIL_KWARGS
+        )
+        plt.close(fig)
+
+        logger.info(f"✅ Saved equity_curve.png")
+        return save_path
+
+    def create_trade_distribution(
+        self,
+        trades: List[Dict],
+        config: Dict[str, Any],
+        save_path: Path,
+    ) -> Path:
+        """
+        Create trade distribution statistics plots.
+
+        4-panel layout:
+        - P&L histogram
+        - Win/Loss pie chart
+        - Trade duration distribution
+        - Entry/Exit reasons
+
+        Args:
+            trades: List of trades
+            config: Configuration
+            save_path: Path to save plot
+
+        Returns:
+            Path to saved plot
+        """
+        if not trades:
+            logger.warning("No trades to plot")
+            return None
+
+        # Create figure
+        plot_config = config.get("plot_config", {})
+        style = plot_config.get("style", {})
+        dpi = plot_config.get("dpi", SAVE_DPI)
+        bg_color = style.get("background_color", self.colors["background"])
+
+        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+        fig.patch.set_facecolor(bg_color)
+
+        for ax in axes.flat:
+            ax.set_facecolor(bg_color)
+
+        stats_text = self._plot_distribution_on(list(axes.flat), trades)
+
+        # Add summary stats box
+        fig.text(
+            0.99,
+            0.01,
+            stats_text,
+            fontsize=9,
+            verticalalignment="bottom",
+            horizontalalignment="right",
+            bbox=dict(boxstyle="round", facecolor="white", alpha=0.8),
+        )
+
+        # Overall title
+        fig.suptitle(
+            "Trade Distribution & Statistics", fontsize=14, fontweight="bold", y=0.98
+        )
+
+        # Save (fixed margins: no layout solver, no tight-bbox extra draw)
+        fig.subplots_adjust(
+            left=0.05, right=0.98, top=0.9, bottom=0.14, hspace=0.25, wspace=0.15
+        )
+        plt.savefig(
+            save_path, dpi=dpi, facecolor=bg_color, pil_kwargs=SAVE_PIL_KWARGS
+        )
+        plt.close(fig)
+
+        logger.info(f"✅ Saved trade_distribution.png")
+        return save_path
+
+    def create_dashboard(
+        self,
+        equity_data: List[Dict],
+        trades: List[Dict],
+        config: Dict[str, Any],
+        save_path: Path,
+    ) -> Path:
+        """
+        Create equity curve and trade distribution on a single figure.
+
+        Same panels as create_equity_curve + create_trade_distribution, but
+        one figure and one savefig (one canvas setup and PNG encode).
+
+        Layout:
+        - Equity curve (full width)
+        - Drawdown (full width)
+        - P&L histogram | Win/Loss pie
+        - Trade duration | Exit reasons
+
+        Args:
+            equity_data: Equity curve points from the engine
+            trades: List of trades
+            config: Configuration
+            save_path: Path to save plot
+
+        Returns:
+            Path to saved plot
+        """
+        if not equity_data or not trades:
+            logger.warning("Dashboard needs both equity data and trades")
+            return None
+
+        equity_col = "equity"
+        if equity_col not in equity_data[0]:
+            logger.error(
+                f"Cannot find '{equity_col}' column. "
+                f"Available: {list(equity_data[0].keys())}"
+            )
+            return None
+
+        # Create figure
+        plot_config = config.get("plot_config", {})
+        style = plot_config.get("style", {})
+        dpi = plot_config.get("dpi", SAVE_DPI)
+        bg_color = style.get("background_color", self.colors["background"])
+
+        fig = plt.figure(figsize=(14, 18))
+        gs = GridSpec(4, 2, figure=fig, height_ratios=[3, 1, 2, 2])
+
+        ax_equity = fig.add_subplot(gs[0, :])
+        ax_dd = fig.add_subplot(gs[1, :], sharex=ax_equity)
+        dist_axes = [
+            fig.add_subplot(gs[2, 0]),
+            fig.add_subplot(gs[2, 1]),
+            fig.add_subplot(gs[3, 0]),
+            fig.add_subplot(gs[3, 1]),
+        ]
+
+        fig.patch.set_facecolor(bg_color)
+        for ax in fig.axes:
+            ax.set_facecolor(bg_color)
+
+        n_pixels = int(fig.get_size_inches()[0] * dpi)
+        self._plot_equity_on(
+            ax_equity, ax_dd, equity_data, trades, equity_col, n_pixels
+        )
+        ax_equity.tick_params(labelbottom=False)
+        stats_text = self._plot_distribution_on(dist_axes, trades)
+
+        # Add summary stats box
+        fig.text(
+            0.99,
+            0.01,
+            stats_text,
+            fontsize=9,
+            verticalalignment="bottom",
+            horizontalalignment="right",
+            bbox=dict(boxstyle="round", facecolor="white", alpha=0.8),
+        )
+
+        fig.suptitle("Backtest Dashboard", fontsize=14, fontweight="bold", y=0.99)
+
+        # Save (fixed margins: no layout solver, no tight-bbox extra draw)
+        fig.subplots_adjust(
+            left=0.07, right=0.98, top=0.93, bottom=0.09, hspace=0.25, wspace=0.15
+        )
+        plt.savefig(
+            save_path, dpi=dpi, facecolor=bg_color, pil_kwargs=SAVE_PIL_KWARGS
+        )
+        plt.close(fig)
+
+        logger.info(f"✅ Saved dashboard.png")
+        return save_path
+
+    # =========================================================================
+    # HELPER METHODS
+    # =========================================================================
+
+    def _plot_equity_on(
+        self,
+        ax_equity: plt.Axes,
+        ax_dd: plt.Axes,
+        equity_data: List[Dict],
+        trades: List[Dict],
+        equity_col: str,
+        n_pixels: int,
+    ):
+        """
+        Draw equity curve and drawdown onto existing axes.
+
+        Args:
+            ax_equity: Axes for equity and peak equity
+            ax_dd: Axes for drawdown
+            equity_data: Equity curve points from the engine
+            trades: List of trades (entry markers)
+            equity_col: Name of the equity field
+            n_pixels: Horizontal pixel budget used for M4 downsampling
+        """
+        # Pull the needed fields straight into arrays (no DataFrame).
+        # Equity data has an 'index' field (bar number), not a timestamp.
+        equity = records_to_array(equity_data, equity_col)
+        if "index" in equity_data[0]:
+            bar_index = records_to_array(equity_data, "index").astype(np.int64)
+        else:
+            bar_index = np.arange(len(equity_data), dtype=np.int64)
+
+        # Calculate drawdown (fused single pass when numba is available)
+        peak, drawdown = drawdown_percent(equity)
+
+        # Downsample long curves to the saved figure resolution (M4)
+        x_equity, y_equity = m4_downsample(bar_index, equity, n_pixels)
+        x_peak, y_peak = m4_downsample(bar_index, peak, n_pixels)
+        x_dd, y_dd = m4_downsample(bar_index, drawdown, n_pixels)
+
         # --- Equity curve ---
         ax_equity.plot(
-            df.index,
-            df[equity_col],  # ← Use variable
+            x_equity,
+            y_equity,
             label="Equity",
             color="#2E86AB",
             linewidth=2,
         )
 
         ax_equity.plot(
-            df.index,
-            df["peak"],
+            x_peak,
+            y_peak,
             label="Peak Equity",
             color="#06A77D",
             linewidth=1,
@@ -478,22 +894,27 @@ class BacktestPlotter:
 
         # Mark trades (if any)
         if trades:
-            # We need to map entry_index to equity curve
-            trade_indices = []
-            trade_equity = []
-
-            for trade in trades:
-                entry_idx = trade.get("entry_index")
-                if entry_idx is not None and entry_idx in df.index:
-                    trade_indices.append(entry_idx)
-                    trade_equity.append(df.loc[entry_idx, equity_col])  # ← Use variable
-
-            if trade_indices:
-                ax_equity.scatter(
+            # Map entry_index to equity curve positions (bar indices are
+            # sorted, so a searchsorted + equality check replaces .loc)
+            entry_idx = records_to_array(trades, "entry_index")
+            entry_idx = entry_idx[~np.isnan(entry_idx)].astype(np.int64)
+            pos = np.searchsorted(bar_index, entry_idx)
+            pos = np.minimum(pos, len(bar_index) - 1)
+            pos = pos[bar_index[pos] == entry_idx]
+            if len(pos) > SCATTER_MAX_POINTS:
+                pos = pos[
+                    lttb_indices(bar_index[pos], equity[pos], max(2000, 2 * n_pixels))
+                ]
+            trade_indices = bar_index[pos]
+            trade_equity = equity[pos]
+
+            if len(trade_indices):
+                ax_equity.plot(
                     trade_indices,
                     trade_equity,
+                    linestyle="None",
                     marker="^",
-                    s=50,
+                    markersize=7,  # scatter s=50
                     color="#F77F00",
                     alpha=0.6,
                     label="Trades",
@@ -501,12 +922,13 @@ class BacktestPlotter:
                 )
 
         # Find max drawdown point
-        max_dd_idx = df["drawdown"].idxmin()
-        max_dd_value = df.loc[max_dd_idx, "drawdown"]
+        max_dd_pos = int(drawdown.argmin())
+        max_dd_idx = bar_index[max_dd_pos]
+        max_dd_value = drawdown[max_dd_pos]
 
         ax_equity.annotate(
             f"Max DD: {max_dd_value:.2f}%",
-            xy=(max_dd_idx, df.loc[max_dd_idx, equity_col]),  # ← FIX: Use variable!
+            xy=(max_dd_idx, equity[max_dd_pos]),
             xytext=(10, -20),
             textcoords="offset points",
             fontsize=9,
@@ -521,19 +943,19 @@ class BacktestPlotter:
         ax_equity.set_title("Equity Curve", fontsize=12, fontweight="bold", pad=10)
 
         # --- Drawdown ---
+        # Drawdown is never positive: no where= mask, one filled polygon
         ax_dd.fill_between(
-            df.index,
-            df["drawdown"],
+            x_dd,
+            y_dd,
             0,
-            where=(df["drawdown"] < 0),
             color="#E74C3C",
             alpha=0.3,
             label="Drawdown",
         )
 
         ax_dd.plot(
-            df.index,
-            df["drawdown"],
+            x_dd,
+            y_dd,
             color="#C0392B",
             linewidth=1.5,
         )
@@ -547,92 +969,65 @@ class BacktestPlotter:
         ax_dd.legend(loc="lower left", fontsize=8)
         ax_dd.grid(True, alpha=0.2)
 
-        # Save
-        plt.tight_layout()
-        plt.savefig(save_path, dpi=150, bbox_inches="tight", facecolor=bg_color)
-        plt.close(fig)
-
-        logger.info(f"✅ Saved equity_curve.png")
-        return save_path
-
-    def create_trade_distribution(
-        self,
-        trades: List[Dict],
-        config: Dict[str, Any],
-        save_path: Path,
-    ) -> Path:
+    def _plot_distribution_on(self, axes: List[plt.Axes], trades: List[Dict]) -> str:
         """
-        Create trade distribution statistics plots.
-
-        4-panel layout:
-        - P&L histogram
-        - Win/Loss pie chart
-        - Trade duration distribution
-        - Entry/Exit reasons
+        Draw the four trade distribution panels onto existing axes.
 
         Args:
+            axes: Four axes (P&L histogram, win/loss pie, duration, exit reasons)
             trades: List of trades
-            config: Configuration
-            save_path: Path to save plot
 
         Returns:
-            Path to saved plot
+            Summary statistics text for the caller's stats box
         """
-        if not trades:
-            logger.warning("No trades to plot")
-            return None
+        # Extract the needed fields as arrays (no DataFrame)
+        n_trades = len(trades)
+        pnl_values = records_to_array(trades, "net_pnl_percent")
+        net_pnl = records_to_array(trades, "net_pnl")
 
-        # Convert to DataFrame
-        df = pd.DataFrame(trades)
-
-        # Create figure
-        plot_config = config.get("plot_config", {})
-        style = plot_config.get("style", {})
-        bg_color = style.get("background_color", self.colors["background"])
-
-        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-        fig.patch.set_facecolor(bg_color)
-
-        for ax in axes.flat:
-            ax.set_facecolor(bg_color)
+        # Open trades carry no P&L yet: drop them once so the histogram,
+        # mean line and stats box all describe the same closed trades
+        pnl_values = pnl_values[np.isfinite(pnl_values)]
+        has_pnl = pnl_values.size > 0
+        pnl_mean = pnl_values.mean() if has_pnl else np.nan
 
         # --- Panel 1: P&L Histogram ---
-        ax_pnl = axes[0, 0]
+        ax_pnl = axes[0]
 
-        # Calculate bins
-        pnl_values = df["net_pnl_percent"].values
-        bins = np.linspace(pnl_values.min(), pnl_values.max(), 30)
+        if has_pnl:
+            # Calculate bins
+            bins = np.linspace(pnl_values.min(), pnl_values.max(), 30)
 
-        colors_hist = ["#27AE60" if x > 0 else "#E74C3C" for x in pnl_values]
-
-        ax_pnl.hist(
-            pnl_values,
-            bins=bins,
-            color="#3498DB",
-            alpha=0.7,
-            edgecolor="black",
-        )
+            ax_pnl.hist(
+                pnl_values,
+                bins=bins,
+                color="#3498DB",
+                alpha=0.7,
+                edgecolor="black",
+            )
 
         ax_pnl.axvline(0, color="black", linestyle="--", linewidth=1.5, alpha=0.8)
-        ax_pnl.axvline(
-            pnl_values.mean(),
-            color="#F39C12",
-            linestyle="-",
-            linewidth=2,
-            label=f"Mean: {pnl_values.mean():.2f}%",
-        )
+        if has_pnl:
+            ax_pnl.axvline(
+                pnl_mean,
+                color="#F39C12",
+                linestyle="-",
+                linewidth=2,
+                label=f"Mean: {pnl_mean:.2f}%",
+            )
 
         ax_pnl.set_xlabel("P&L (%)", fontsize=10, fontweight="bold")
         ax_pnl.set_ylabel("Frequency", fontsize=10, fontweight="bold")
         ax_pnl.set_title("P&L Distribution", fontsize=11, fontweight="bold")
-        ax_pnl.legend(fontsize=9)
+        if has_pnl:
+            ax_pnl.legend(fontsize=9)
         ax_pnl.grid(True, alpha=0.2)
 
         # --- Panel 2: Win/Loss Pie ---
-        ax_pie = axes[0, 1]
+        ax_pie = axes[1]
 
-        wins = (df["net_pnl"] > 0).sum()
-        losses = (df["net_pnl"] <= 0).sum()
+        wins = int(np.count_nonzero(net_pnl > 0))
+        losses = int(np.count_nonzero(net_pnl <= 0))
 
         labels = [f"Wins ({wins})", f"Losses ({losses})"]
         sizes = [wins, losses]
@@ -650,10 +1045,10 @@ class BacktestPlotter:
         ax_pie.set_title("Win/Loss Ratio", fontsize=11, fontweight="bold")
 
         # --- Panel 3: Trade Duration ---
-        ax_duration = axes[1, 0]
+        ax_duration = axes[2]
 
-        if "trade_duration_minutes" in df.columns:
-            durations = df["trade_duration_minutes"].values
+        if any("trade_duration_minutes" in trade for trade in trades):
+            durations = records_to_array(trades, "trade_duration_minutes")
 
             ax_duration.hist(
                 durations,
@@ -691,17 +1086,33 @@ class BacktestPlotter:
             ax_duration.set_title("Trade Duration", fontsize=11, fontweight="bold")
 
         # --- Panel 4: Exit Reasons ---
-        ax_reasons = axes[1, 1]
-
-        if "exit_reason" in df.columns:
-            exit_counts = df["exit_reason"].value_counts()
+        ax_reasons = axes[3]
+
+        if any("exit_reason" in trade for trade in trades):
+            # Only counts are needed: np.unique instead of pandas machinery.
+            # np.unique sorts alphabetically; reorder most-frequent first,
+            # ties by first appearance, exactly as value_counts did
+            reasons, first_seen, counts = np.unique(
+                np.asarray(
+                    [
+                        str(trade["exit_reason"])
+                        for trade in trades
+                        if trade.get("exit_reason") is not None
+                    ],
+                    dtype=str,
+                ),
+                return_index=True,
+                return_counts=True,
+            )
+            order = np.lexsort((first_seen, -counts))
+            reasons, counts = reasons[order], counts[order]
 
             colors_reasons = ["#3498DB", "#E74C3C", "#F39C12", "#9B59B6", "#1ABC9C"]
 
             ax_reasons.barh(
-                exit_counts.index,
-                exit_counts.values,
-                color=colors_reasons[: len(exit_counts)],
+                reasons,
+                counts,
+                color=colors_reasons[: len(counts)],
                 alpha=0.7,
                 edgecolor="black",
             )
@@ -721,41 +1132,16 @@ class BacktestPlotter:
             )
             ax_reasons.set_title("Exit Reasons", fontsize=11, fontweight="bold")
 
-        # Add summary stats box
+        # Summary stats (drawn in a text box by the caller)
         stats_text = (
-            f"Total Trades: {len(df)}\n"
-            f"Win Rate: {wins/len(df)*100:.1f}%\n"
-            f"Avg P&L: {df['net_pnl_percent'].mean():+.2f}%\n"
-            f"Best Trade: {df['net_pnl_percent'].max():+.2f}%\n"
-            f"Worst Trade: {df['net_pnl_percent'].min():+.2f}%"
-        )
-
-        fig.text(
-            0.99,
-            0.01,
-            stats_text,
-            fontsize=9,
-            verticalalignment="bottom",
-            horizontalalignment="right",
-            bbox=dict(boxstyle="round", facecolor="white", alpha=0.8),
-        )
-
-        # Overall title
-        fig.suptitle(
-            "Trade Distribution & Statistics", fontsize=14, fontweight="bold", y=0.98
+            f"Total Trades: {n_trades}\n"
+            f"Win Rate: {wins/n_trades*100:.1f}%\n"
+            f"Avg P&L: {pnl_mean:+.2f}%\n"
+            f"Best Trade: {pnl_values.max() if has_pnl else np.nan:+.2f}%\n"
+            f"Worst Trade: {pnl_values.min() if has_pnl else np.nan:+.2f}%"
         )
 
-        # Save
-        plt.tight_layout(rect=[0, 0.03, 1, 0.96])
-        plt.savefig(save_path, dpi=150, bbox_inches="tight", facecolor=bg_color)
-        plt.close(fig)
-
-        logger.info(f"✅ Saved trade_distribution.png")
-        return save_path
-
-    # =========================================================================
-    # HELPER METHODS
-    # =========================================================================
+        return stats_text
 
     def _collect_plot_indicators(
         self,
@@ -807,14 +1193,26 @@ class BacktestPlotter:
         # Generate column name (same logic as IndicatorManager)
         column_name = self._generate_column_name(ind_config)
 
+        # Same indicator declared by several strategies: load/draw it once
+        if any(ind["column"] == column_name for ind in overlays + panels):
+            return
+
         # Check if column exists in data
         if column_name not in data.columns:
             logger.warning(f"Column {column_name} not found in data, skipping")
             return
 
+        # Materialize values once as a float32 array (plenty for plotting);
+        # the overlay/panel loops use this instead of the pandas column
+        values = data[column_name].to_numpy(dtype=np.float32)
+        if values.size == 0 or not np.isfinite(values).any():
+            logger.warning(f"Column {column_name} has no finite values, skipping")
+            return
+
         # Extract visual properties
         ind_info = {
             "column": column_name,
+            "values": values,
             "label": visual.get("label", column_name.upper()),
             "color": visual.get("color", "#3498DB"),
             "linewidth": visual.get("linewidth", 1.5),
@@ -895,6 +1293,8 @@ class BacktestPlotter:
         ax: plt.Axes,
         data: pd.DataFrame,
         trades: List[Dict],
+        trade_times: Optional[Tuple[pd.DatetimeIndex, pd.DatetimeIndex]] = None,
+        x_num: Optional[np.ndarray] = None,
     ):
         """
         Plot position timeline (LONG/SHORT/FLAT).
@@ -903,6 +1303,8 @@ class BacktestPlotter:
             ax: Matplotlib axis
             data: DataFrame with price data
             trades: List of trades
+            trade_times: Optional pre-parsed (entry_times, exit_times)
+            x_num: Optional precomputed matplotlib date numbers of data.index
         """
         if not trades:
             ax.text(
@@ -916,51 +1318,57 @@ class BacktestPlotter:
             )
             return
 
-        # Create position series
-        position = pd.Series(0, index=data.index)
+        # Create position buffer (plain NumPy writes, no pandas __setitem__)
+        position = np.zeros(len(data.index), dtype=np.int8)
 
-        for trade in trades:
-            entry_time = pd.to_datetime(trade["entry_time"])
-            exit_time = pd.to_datetime(trade["exit_time"])
+        if trade_times is None:
+            trade_times = parse_trade_times(trades)
+        entry_times, exit_times = trade_times
 
-            # Find indices
-            mask = (data.index >= entry_time) & (data.index <= exit_time)
+        # Find [entry, exit] bar ranges for all trades with one binary search
+        starts = data.index.searchsorted(entry_times, side="left")
+        ends = data.index.searchsorted(exit_times, side="right")
 
+        for trade, start, end in zip(trades, starts, ends):
             # FIX: Use 'position_type' field (lowercase)
             position_type = trade["position_type"]  # ← Correct field
 
             # Set position value
             if position_type == "long":  # ← lowercase comparison
-                position.loc[mask] = 1
+                position[start:end] = 1
             elif position_type == "short":  # ← lowercase comparison
-                position.loc[mask] = -1
+                position[start:end] = -1
+
+        if x_num is None:
+            x_num = dates_to_num(data.index)
 
-        # Plot as filled area
+        # Plot as filled area: clipping instead of where= masks draws each
+        # side as one polygon rather than one per position run
         ax.fill_between(
-            data.index,
+            x_num,
             0,
-            position,
-            where=(position > 0),
+            np.clip(position, 0, None),
             color=self.colors["long"],
             alpha=0.3,
+            linewidth=0,
             label="LONG",
             step="post",
         )
 
         ax.fill_between(
-            data.index,
+            x_num,
             0,
-            position,
-            where=(position < 0),
+            np.clip(position, None, 0),
             color=self.colors["short"],
             alpha=0.3,
+            linewidth=0,
             label="SHORT",
             step="post",
         )
 
         # Plot line
         ax.plot(
-            data.index,
+            x_num,
             position,
             color="black",
             linewidth=1,